@@ -3,25 +3,42 @@ Database package exports
 
 This makes it easy to import database components from anywhere in the app:
 
-    from app.external.database import DatabaseSession, Base, BoardGame
+    from app.dependencies.external.database import DatabaseSession, Base, BoardGame
     
 Instead of:
 
-    from app.external.database.database import DatabaseSession, Base
-    from app.external.database.models import BoardGame
+    from app.dependencies.external.database.database import DatabaseSession, Base
+    from app.dependencies.external.database.models import BoardGame
+
+This package is the only place models are defined: always import them from
+here, so each table is mapped exactly once.
 """
 
-from .database import Base, DatabaseSession, get_db, init_db
-from .models import BoardGame
-from .settings import settings
+from .database import (
+    Base,
+    DatabaseSession,
+    async_session_maker,
+    check_alembic_head,
+    get_db,
+    init_db,
+    warm_pool,
+)
+from .models import BoardGame, User, UsersGames
+from .settings import get_settings, settings
 
 __all__ = [
     # Database infrastructure
     "Base",
     "DatabaseSession",
+    "async_session_maker",
+    "check_alembic_head",
     "get_db",
     "init_db",
+    "warm_pool",
+    "get_settings",
     "settings",
     # Models
     "BoardGame",
+    "User",
+    "UsersGames",
 ]
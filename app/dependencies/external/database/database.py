@@ -14,8 +14,12 @@ Educational Note: Why Async?
 - This is similar to the async httpx example you saw earlier!
 """
 
+import asyncio
+import logging
+import time
 from collections.abc import AsyncGenerator
 from typing import Annotated
+from uuid import uuid4
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import (
@@ -24,35 +28,104 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import DateTime
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import DateTime, MetaData, event, func, text
+from sqlalchemy.exc import ProgrammingError
 
-from datetime import datetime, timezone
+from datetime import datetime
 
 from .settings import settings
 
 
+logger = logging.getLogger(__name__)
+
+
 # ============================================================================
 # PART 1: Create the Async Engine
 # ============================================================================
 # The engine is the core interface to the database
 # - create_async_engine: Creates an async-compatible engine
-# - str(settings.url): Converts the PostgresDsn to a string
-# - echo: If True, logs all SQL queries (useful for learning!)
-# - pool_pre_ping: Tests connections before using them (prevents stale connections)
+# - settings.url: The connection string (already a plain str, no conversion)
+# - echo: If True, logs all SQL queries (useful for learning!), never in prod
+# - echo_pool: If True, logs connection pool activity, never in prod
+# - poolclass: AsyncAdaptedQueuePool is the asyncio-safe QueuePool (made explicit)
+# - pool_recycle: Replaces connections older than N seconds, before the server
+#   or a NAT drops them and a request has to pay for a fresh handshake
+# - pool_pre_ping: Tests connections before using them (off by default: it costs
+#   an extra round-trip per request, pool_recycle covers the common case)
+# - connect_args: Passed straight to asyncpg.connect() (see below)
+
+# asyncpg connection arguments
+# - server_settings: Run for every new connection
+#   - jit=off: PostgreSQL's JIT compiles plans with LLVM, which costs more than
+#     it saves for the tiny OLTP queries this API runs
+#   - application_name: Shows up in pg_stat_activity
+# - statement_cache_size: asyncpg's prepared statement cache
+# - prepared_statement_cache_size: SQLAlchemy's own cache on top of asyncpg
+if settings.pgbouncer_transaction_mode:
+    statement_cache_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        # Unique names, so statements never clash across pooled server connections
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+else:
+    statement_cache_args = {
+        "statement_cache_size": settings.statement_cache_size,
+        "prepared_statement_cache_size": settings.statement_cache_size,
+    }
+
+is_production = settings.environment == "prod"
 
 engine = create_async_engine(
-    str(settings.url),
-    echo=settings.echo,  # Set to True in .env to see SQL queries
+    settings.url,
+    echo=settings.echo and not is_production,  # Set to True in .env to see SQL queries
+    echo_pool=settings.echo_pool and not is_production,
+    poolclass=AsyncAdaptedQueuePool,
     pool_size=settings.pool_size,
     max_overflow=settings.max_overflow,
     pool_timeout=settings.pool_timeout,  # Wait time for available connection
+    pool_recycle=settings.pool_recycle,  # Rotate connections (default: 30 minutes)
     pool_pre_ping=settings.pool_pre_ping,  # Verify connections are alive before using
+    query_cache_size=settings.query_cache_size,  # Compiled SQL cache (default is 500)
     connect_args={
-        "ssl": True
+        "ssl": True,
+        "server_settings": {
+            "jit": "off",
+            "application_name": "boardgames-api",
+        },
+        **statement_cache_args,
     }
 )
 
 
+# Keep SQL statements out of production logs, even if logging is set to INFO
+if is_production:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+
+# ============================================================================
+# Slow Query Logging
+# ============================================================================
+# Instead of echoing every statement, time each one and only log the slow ones.
+# - before_cursor_execute / after_cursor_execute: run around each statement
+# - conn.info: a per-connection dict, used here to keep the start time
+# - The statement is passed as a logging argument, so it's only formatted
+#   when the log record is actually emitted (parameters are never logged)
+
+if settings.slow_query_threshold_ms:
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        if elapsed_ms > settings.slow_query_threshold_ms:
+            logger.warning("Slow query (%.1f ms): %s", elapsed_ms, statement)
+
+
 # ============================================================================
 # PART 2: Create the Session Factory
 # ============================================================================
@@ -76,6 +149,20 @@ async_session_maker = async_sessionmaker(
 # All database models will inherit from this base class
 # This is how SQLAlchemy knows which classes represent database tables
 
+# Naming convention for indexes and constraints
+# Without it, PostgreSQL picks the names of unnamed constraints itself; with it,
+# every name is derived from the table/column names and is the same on every
+# database, so create_all and migrations always agree on what already exists
+metadata = MetaData(
+    naming_convention={
+        "ix": "ix_%(column_0_label)s",
+        "uq": "uq_%(table_name)s_%(column_0_name)s",
+        "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+        "pk": "pk_%(table_name)s",
+    }
+)
+
+
 class Base(DeclarativeBase):
     """
     Base class for all ORM models.
@@ -92,15 +179,38 @@ class Base(DeclarativeBase):
             name: Mapped[str] = mapped_column(String(100))
     """
 
+    # Every table is registered in the metadata above (with its naming convention)
+    metadata = metadata
+
+    # Mapper options shared by every model
+    # - eager_defaults: fetch server-generated values (id, created_at,
+    #   updated_at) with INSERT/UPDATE ... RETURNING, in the same round-trip,
+    #   instead of needing a follow-up SELECT (db.refresh) to read them
+    # - confirm_deleted_rows=False: skip checking the rowcount after an ORM
+    #   DELETE (a missing row is already reported as 404 by the routes)
+    __mapper_args__ = {
+        "eager_defaults": True,
+        "confirm_deleted_rows": False,
+    }
+
     # Timestamps
     # - Automatically set when record is created/updated
-    # - default= runs on the Python side (when object is created)
+    # - server_default=func.now(): PostgreSQL fills in created_at on INSERT,
+    #   so Python doesn't build (or send) a datetime for it
+    # - onupdate=func.now(): SQLAlchemy adds "updated_at = now()" to every
+    #   UPDATE, again evaluated by the database rather than in Python
+    # - DateTime(timezone=True): TIMESTAMP WITH TIME ZONE, timezone-aware values
     # - These are great for auditing
-    created_at: Mapped[datetime] = mapped_column(default=datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),  # Auto-update on any modification
-        nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),  # Auto-update on any modification
+        nullable=False,
     )
 
     pass
@@ -124,6 +234,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     The 'async with' ensures:
     - Session is properly closed even if an exception occurs
     - Resources are cleaned up automatically
+    (so no explicit session.close() is needed)
     
     Usage in routes:
         @router.get("/games")
@@ -137,10 +248,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     - You don't manually create/close sessions - it's automatic!
     """
     async with async_session_maker() as session:
-        try:
-            yield session  # This is where the route handler runs
-        finally:
-            await session.close()  # Always cleanup, even on errors
+        yield session  # This is where the route handler runs
+    # Leaving 'async with' closes the session, even on errors
 
 
 # ============================================================================
@@ -171,8 +280,55 @@ async def init_db() -> None:
     3. Should be called on application startup
     
     Note: In production, you'd use Alembic for migrations instead!
+    That's why this does nothing unless settings.auto_create_tables is on
+    (the default everywhere except ENV=prod).
     """
+    if not settings.auto_create_tables:
+        return
+
     async with engine.begin() as conn:
         # Create all tables defined by Base subclasses
         # This is equivalent to running CREATE TABLE for each model
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def check_alembic_head() -> str:
+    """
+    Check that the database schema is managed (and migrated) by Alembic.
+    
+    Used on startup instead of init_db() when tables aren't auto-created:
+    a single "SELECT version_num FROM alembic_version" rather than one
+    existence check per table.
+    
+    Returns the current migration revision.
+    Raises RuntimeError if the database has never been migrated.
+    """
+    async with engine.connect() as conn:
+        try:
+            revision = await conn.scalar(text("SELECT version_num FROM alembic_version"))
+        except ProgrammingError as exc:
+            raise RuntimeError(
+                "Database has no alembic_version table: run the migrations first"
+            ) from exc
+
+    if revision is None:
+        raise RuntimeError("Database has no Alembic revision: run the migrations first")
+
+    return revision
+
+
+async def warm_pool() -> None:
+    """
+    Open pool_size connections before the app starts serving requests.
+    
+    The pool is lazy: connections are only created when first needed, so
+    the first requests after startup would each pay for a full connect
+    (TCP + TLS + PostgreSQL authentication). Checking out pool_size
+    connections at the same time forces all of them to be opened now;
+    they go back to the pool, ready to be reused.
+    """
+    async def _open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_open_connection() for _ in range(settings.pool_size)))
@@ -20,7 +20,7 @@ You write:
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import String, Text, Integer, ForeignKey
+from sqlalchemy import String, Text, Integer, ForeignKey, Index, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
@@ -46,13 +46,21 @@ class BoardGame(Base):
         max_playtime INTEGER,
         year_published INTEGER,
         rating NUMERIC(3, 1),
-        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
     );
     """
     
     __tablename__ = "boardgames"
     
+    # Composite / secondary indexes
+    # - (rating, id): "top rated" listings, with id as a stable tie-breaker
+    # - year_published: filtering by publication year
+    __table_args__ = (
+        Index("ix_boardgames_rating_id", "rating", "id"),
+        Index("ix_boardgames_year_published", "year_published"),
+    )
+    
     # Primary Key
     # - auto-increment by default
     # - required for all tables
@@ -84,9 +92,20 @@ class BoardGame(Base):
     
     # Rating (e.g., 7.5 out of 10)
     # - NUMERIC(3, 1) allows values like 7.5 (3 digits total, 1 after decimal)
-    rating: Mapped[Optional[float]] = mapped_column(nullable=True)
+    # - asdecimal=False: rows come back as plain Python floats instead of
+    #   (much slower to build) decimal.Decimal objects
+    rating: Mapped[Optional[float]] = mapped_column(
+        Numeric(3, 1, asdecimal=False),
+        nullable=True,
+    )
     
-    users_games: Mapped["UsersGames"] = relationship(back_populates="boardgame_id")
+    # Links to the users that own this game
+    # - lazy="selectin": collections load with one extra "WHERE id IN (...)"
+    #   query for all games at once, instead of one query per game (N+1)
+    users_games: Mapped[list["UsersGames"]] = relationship(
+        back_populates="boardgame_map",
+        lazy="selectin",
+    )
     
     def __repr__(self) -> str:
         """String representation for debugging"""
@@ -102,7 +121,10 @@ class User(Base):
     surname: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
     email: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
 
-    users_games: Mapped["UsersGames"] = relationship(back_populates="user_id")
+    users_games: Mapped[list["UsersGames"]] = relationship(
+        back_populates="user_map",
+        lazy="selectin",
+    )
   
 
 class UsersGames(Base):
@@ -112,6 +134,14 @@ class UsersGames(Base):
     boardgame_id: Mapped[int] = mapped_column(ForeignKey("boardgames.id"))
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
 
-    boardgame_map: Mapped["BoardGame"] = relationship(back_populates="users_games")
-    user_map: Mapped["User"] = relationship(back_populates="users_games")
+    # Many-to-one sides: a single row each, so a JOIN is cheaper than
+    # a follow-up query (lazy="joined")
+    boardgame_map: Mapped["BoardGame"] = relationship(
+        back_populates="users_games",
+        lazy="joined",
+    )
+    user_map: Mapped["User"] = relationship(
+        back_populates="users_games",
+        lazy="joined",
+    )
 
@@ -0,0 +1,13 @@
+"""
+Internal dependencies
+
+Building blocks that live inside the application process (as opposed to
+external services like the database):
+
+    from app.dependencies.internal import TTLCache, WriteBatcher
+"""
+
+from .batcher import WriteBatcher
+from .cache import TTLCache
+
+__all__ = ["TTLCache", "WriteBatcher"]
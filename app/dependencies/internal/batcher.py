@@ -0,0 +1,186 @@
+"""
+Write Batcher
+
+Runs database writes from many requests in shared transactions.
+
+Educational Note: Why batch commits?
+------------------------------------
+Every COMMIT makes PostgreSQL flush its write-ahead log (WAL) to disk
+before answering. With one transaction per request, a burst of 50 PATCH
+requests means 50 flushes, one after the other.
+
+The batcher collects the writes that arrive within a few milliseconds
+(up to max_batch of them) and runs them in one transaction: one COMMIT,
+one flush, for the whole group. Each request waits for "its" write to
+be committed and then gets its result back.
+
+Trade-off: a write may wait up to max_wait seconds for others to join
+its batch, so single requests get slightly slower while throughput under
+load goes up.
+
+If any write in a batch fails, the whole transaction is rolled back and
+the writes are retried one transaction each, so one bad request can't
+fail the others.
+
+Educational Note: The costs of one flusher
+------------------------------------------
+- Batches run one after another, on one connection per worker. If a
+  write has to wait for a row lock (another transaction is changing the
+  same game), every write queued behind it waits too.
+- A batch transaction locks several rows. Two workers' batches locking
+  the same rows in a different order can deadlock, which one-row
+  transactions never could. PostgreSQL detects it and aborts one of
+  them, which is then retried write by write like any failed batch.
+
+To bound both, batch transactions on PostgreSQL run with
+SET LOCAL lock_timeout (lock_timeout_ms): a batch stuck on a lock gives
+up quickly and falls back to one transaction per write, which wait for
+locks as normal.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+T = TypeVar("T")
+
+# A write: receives the (shared) session, returns its result
+WriteOp = Callable[[AsyncSession], Awaitable[Any]]
+QueueItem = Optional[tuple[WriteOp, asyncio.Future]]
+
+
+class WriteBatcher:
+    """
+    Queues write operations and commits them in batches.
+
+    Example usage:
+        batcher = WriteBatcher(async_session_maker)
+        await batcher.start()               # e.g. in the lifespan
+
+        async def rename(session: AsyncSession) -> int:
+            result = await session.execute(update(...).where(...))
+            return result.rowcount
+
+        rowcount = await batcher.submit(rename)  # returns once committed
+
+        await batcher.stop()                # flushes what's left
+
+    Operations must not commit themselves - the batcher does that.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch: int = 64,
+        max_wait: float = 0.005,
+        lock_timeout_ms: int = 1000,
+    ) -> None:
+        self._session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.lock_timeout_ms = lock_timeout_ms
+        # (operation, future) pairs; None tells the flusher to stop
+        # Created by start(): an asyncio.Queue belongs to the event loop that
+        # first uses it, and each app lifespan may run in a new loop (tests)
+        self._queue: Optional[asyncio.Queue[QueueItem]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Starts the background flusher."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._flusher(self._queue))
+
+    async def stop(self) -> None:
+        """Commits the writes still queued, then stops the flusher."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            await self._queue.put(None)
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._queue = None
+
+    async def submit(self, op: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Queues `op` and returns its result once it has been committed."""
+        if self._task is None or self._task.done():
+            raise RuntimeError("WriteBatcher is not running (call start() first)")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, future))
+        return await future
+
+    async def _flusher(self, queue: asyncio.Queue[QueueItem]) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        batch: list[tuple[WriteOp, asyncio.Future]] = []
+
+        try:
+            while not stopping:
+                # Wait for the first write, then give others max_wait to join
+                item = await queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                deadline = loop.time() + self.max_wait
+
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                await self._run(batch)
+                batch = []
+        finally:
+            # However the flusher ends, nobody may be left waiting forever:
+            # fail the batch in progress (if any) and everything still queued
+            while not queue.empty():
+                if (item := queue.get_nowait()) is not None:
+                    batch.append(item)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("WriteBatcher stopped"))
+
+    async def _run(self, batch: list[tuple[WriteOp, asyncio.Future]]) -> None:
+        try:
+            results = await self._execute(batch)
+        except Exception as exc:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                # One failing write aborts the whole transaction:
+                # retry them one by one so only the culprit gets the error
+                for item in batch:
+                    await self._run([item])
+            return
+
+        for (_, future), result in zip(batch, results):
+            # The request may have been cancelled (client went away)
+            if not future.done():
+                future.set_result(result)
+
+    async def _execute(self, batch: list[tuple[WriteOp, asyncio.Future]]) -> list[Any]:
+        """Runs the batch's operations in one transaction and commits it."""
+        async with self._session_factory() as session:
+            if len(batch) > 1 and self.lock_timeout_ms:
+                # Don't let a shared transaction sit on a lock (see module notes)
+                connection = await session.connection()
+                if connection.dialect.name == "postgresql":
+                    await session.execute(
+                        text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}")
+                    )
+            results = [await op(session) for op, _ in batch]
+            await session.commit()
+        return results
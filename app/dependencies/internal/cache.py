@@ -0,0 +1,117 @@
+"""
+In-Memory Response Cache
+
+A small time-to-live (TTL) cache for ready-to-send response bodies.
+
+Educational Note: Why cache responses?
+--------------------------------------
+Most requests to a catalogue like this one are reads, and the same game is
+read over and over. Keeping the final JSON bytes for a short while means a
+repeated GET costs a dictionary lookup instead of a database round-trip plus
+serialization.
+
+The catch is staleness: whenever a game changes, the cached copies must be
+dropped (invalidated), which is why the write endpoints call invalidate().
+
+Invalidation alone leaves a race: a reader can run its SELECT before a
+write commits and store the (old) result after the write invalidated the
+cache. Every invalidation therefore bumps a generation counter; readers
+note the generation before querying and pass it to set(), which refuses
+to store anything if an invalidation happened in between.
+
+Note: The cache lives inside one Python process. With several workers each
+has its own copy, and a write only clears the cache of the worker that
+handled it - other workers may serve the old data until the TTL expires.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class TTLCache:
+    """
+    Maps string keys to bytes, forgetting entries after `ttl` seconds.
+
+    At most `max_entries` are kept, holding at most `max_bytes` in total:
+    when full, the least recently used entries are dropped to make room.
+    Values bigger than `max_bytes` on their own are never stored. Counting
+    entries alone isn't enough: a list page can be megabytes of JSON.
+
+    Example usage:
+        cache = TTLCache(ttl=60, max_entries=1024, max_bytes=16 * 1024 * 1024)
+        cache.set("/games/1", b'{"id": 1, ...}')
+        cache.get("/games/1")          # b'{"id": 1, ...}' (for 60 seconds)
+        cache.invalidate("/games/1")   # gone
+    
+    Storing a value read from the database:
+        generation = cache.generation  # before the query
+        body = await load_from_db()
+        cache.set("/games/1", body, generation)  # skipped if invalidated since
+    """
+
+    def __init__(self, ttl: float, max_entries: int, max_bytes: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expires_at, value), oldest first
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        # Total size of the cached values
+        self._size = 0
+        # Bumped by every invalidation (see set())
+        self.generation = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, generation: Optional[int] = None) -> None:
+        """
+        Stores a value, evicting the least recently used entry if full.
+        
+        If `generation` is given and the cache has been invalidated since
+        it was read, the value may be stale and isn't stored.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self._remove(key)
+        if len(value) > self.max_bytes:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._size += len(value)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def invalidate(self, key: str) -> None:
+        """Drops a single entry (if present)."""
+        self.generation += 1
+        self._remove(key)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drops every entry whose key starts with `prefix`."""
+        self.generation += 1
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drops everything."""
+        self.generation += 1
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
@@ -6,7 +6,8 @@ This is the entry point for the FastAPI application.
 Educational Note: Application Lifecycle
 ----------------------------------------
 1. Application starts → lifespan events run
-2. Database tables are created (if they don't exist)
+2. Database tables are created (if they don't exist), or in production the
+   Alembic migration revision is checked
 3. Application is ready to receive requests
 4. Each request gets its own database session via dependency injection
 5. Session closes automatically after request completes
@@ -17,7 +18,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.dependencies.external.database import init_db
+from app.dependencies.external.database import (
+    check_alembic_head,
+    init_db,
+    settings,
+    warm_pool,
+)
 from app.routers import v1_router
 
 
@@ -33,7 +39,8 @@ async def lifespan(app: FastAPI):
     Application lifespan handler.
     
     Startup:
-    - Initialize database tables
+    - Initialize database tables (or check the Alembic revision in production)
+    - Open the pool's connections up front
     
     Shutdown:
     - Clean up resources (if needed)
@@ -49,8 +56,16 @@ async def lifespan(app: FastAPI):
     # Startup: Create database tables
     print("🚀 Starting up...")
     print("📊 Initializing database...")
-    await init_db()
-    print("✅ Database initialized!")
+    if settings.auto_create_tables:
+        await init_db()
+        print("✅ Database initialized!")
+    else:
+        revision = await check_alembic_head()
+        print(f"✅ Database schema at revision {revision}")
+    
+    # Open the connections now, so the first requests don't pay for them
+    await warm_pool()
+    print(f"🔌 Connection pool warmed up ({settings.pool_size} connections)")
     
     yield  # Application runs here
     
@@ -0,0 +1,49 @@
+"""
+Custom Response Classes
+
+Response classes shared by the API routers.
+
+Educational Note: How FastAPI normally builds JSON
+--------------------------------------------------
+When an endpoint returns a Pydantic model, FastAPI first converts it to
+plain dicts/lists (jsonable_encoder) and then encodes those with Python's
+standard json module. Both steps run in Python, field by field.
+
+Pydantic v2 can do the whole thing itself: model_dump_json() walks the
+model in pydantic-core (Rust) and produces the JSON text in one go.
+PydanticJSONResponse uses that path, so endpoints returning it skip
+FastAPI's conversion entirely.
+
+pydantic-core can encode plain dicts and lists the same way (datetimes
+included), so a handler doesn't even need a model instance: a dict of
+column values, e.g. straight from a database row, works too.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Union
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered straight from a Pydantic model (or plain data).
+
+    Usage in routes:
+        @router.get("/games/{game_id}", response_class=PydanticJSONResponse)
+        async def get_game(...) -> PydanticJSONResponse:
+            return PydanticJSONResponse(BoardGameResponse.model_construct(...))
+
+    The content can be a Pydantic model or plain dicts/lists, such as a
+    TypedDict built from a database row.
+    
+    Note: FastAPI doesn't validate or document what's inside a Response,
+    so declare the schema with responses={200: {"model": ...}} on the route.
+    """
+
+    def render(
+        self, content: Union[BaseModel, Mapping[str, Any], Sequence[Any]]
+    ) -> bytes:
+        return to_json(content)
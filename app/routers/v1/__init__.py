@@ -17,8 +17,10 @@ Example URL structure:
 
 from fastapi import APIRouter
 
+from app.dependencies.external.database import async_session_maker
+
 from .users import router as users_router
-from .boardgames import router as boardgames_router
+from .boardgames import make_write_router, router as boardgames_router
 
 # Create the main v1 router
 # All routes from sub-routers will be prefixed with whatever is set in main.py
@@ -26,6 +28,7 @@ v1_router = APIRouter()
 
 # Include all v1 routers
 v1_router.include_router(boardgames_router)
+v1_router.include_router(make_write_router(async_session_maker))  # PATCH/DELETE
 v1_router.include_router(users_router)
 
 __all__ = ["v1_router"]
\ No newline at end of file
@@ -11,37 +11,130 @@ These are the four basic operations for any database-backed API:
 - READ: GET /games (list all) and GET /games/{id} (get one)
 - UPDATE: PATCH /games/{id} (modify existing)
 - DELETE: DELETE /games/{id} (remove)
+
+Educational Note: Trusted responses
+-----------------------------------
+The handlers build their responses themselves from database rows, with
+board_game_to_response() or, on the hot read paths, board_game_to_dict()
+(no validation: the data is already trusted), and return them as
+PydanticJSONResponse, which pydantic-core turns into JSON bytes
+directly. FastAPI doesn't validate or re-encode them; the schemas still
+show up in the docs through responses={...}.
 """
-from typing import Annotated
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, status, Query, Depends
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, FastAPI, HTTPException, status, Query, Depends
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import Boolean, Row, bindparam, case, select, func, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased, raiseload, selectinload
 
-from app.dependencies.external.database.models import BoardGame
-from app.dependencies.external.database import DatabaseSession
+from app.dependencies.external.database import BoardGame, DatabaseSession, UsersGames
+from app.dependencies.internal import TTLCache, WriteBatcher
+from app.routers.responses import PydanticJSONResponse
 
 from .dtos import (
     BoardGameCreate,
     BoardGameUpdate,
     BoardGameResponse,
     BoardGameListResponse,
+    BOARD_GAME_LIST_ADAPTER,
+    board_game_row_to_dict,
+    board_game_to_dict,
+    board_game_to_response,
+    board_game_with_users_to_dict,
 )
 
 
 # Create the router
 # - prefix: All routes in this file will start with /games
 # - tags: Groups endpoints in the API documentation
+# PATCH and DELETE live on a separate router, see make_write_router()
 router = APIRouter(prefix="/games", tags=["Board Games"])
 
 
+# The Core Table behind BoardGame, for statements that don't need the ORM
+_BOARDGAMES = BoardGame.__table__
+
+# Statements built once at import time and reused by every request
+# - bindparam("game_id"): placeholder filled in at execution time
+# - SQLAlchemy caches the compiled SQL, so the hot path only binds the value
+# - raiseload("*"): responses never include users_games, so don't load it
+#   (its lazy="selectin" would otherwise cost a second SELECT per game)
+_GET_BY_ID = (
+    select(BoardGame)
+    .where(BoardGame.id == bindparam("game_id"))
+    .options(raiseload("*"))
+)
+
+# Columns a PATCH is allowed to change (anything else is never written)
+_UPDATABLE_FIELDS = (
+    "name",
+    "description",
+    "min_players",
+    "max_players",
+    "min_playtime",
+    "max_playtime",
+    "year_published",
+    "rating",
+)
+
+# PATCH and DELETE statements with fixed SQL text
+# asyncpg prepares each distinct SQL string once per connection and reuses
+# it afterwards (only bind + execute). An UPDATE listing just the fields a
+# client sent would be a different statement for every combination of
+# fields (up to 2^8), each prepared separately. Instead, _UPDATE_BY_ID
+# always lists every column, with a flag per column:
+#     SET name = CASE WHEN :set_name THEN :new_name ELSE name END, ...
+# so one prepared statement covers every PATCH, including setting a
+# column to NULL (which COALESCE(:new_name, name) couldn't do).
+_UPDATE_BY_ID = (
+    _BOARDGAMES.update()
+    .where(_BOARDGAMES.c.id == bindparam("game_id"))
+    .values({
+        _BOARDGAMES.c[field]: case(
+            (
+                bindparam(f"set_{field}", type_=Boolean),
+                bindparam(f"new_{field}", type_=_BOARDGAMES.c[field].type),
+            ),
+            else_=_BOARDGAMES.c[field],
+        )
+        for field in _UPDATABLE_FIELDS
+    })
+    .returning(_BOARDGAMES)
+)
+_DELETE_BY_ID = _BOARDGAMES.delete().where(_BOARDGAMES.c.id == bindparam("game_id"))
+
+# Rows fetched from the database per batch when streaming an export
+_EXPORT_BATCH_SIZE = 200
+
+# Cache of rendered GET responses (JSON bytes), kept for up to 60 seconds
+# - "game:<id>" for single games, "games:<query params>" for list pages
+# - Every write drops the entries it makes stale (see create/update/delete)
+# - At most 16 MB per worker: clients choose skip/limit/after_id freely, and
+#   a 500-game page can be megabytes, so entries alone aren't a real cap
+_response_cache = TTLCache(ttl=60, max_entries=1024, max_bytes=16 * 1024 * 1024)
+_LIST_CACHE_PREFIX = "games:"
+
+
+def _game_cache_key(game_id: int) -> str:
+    return f"game:{game_id}"
+
+
+def _cached_json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
 # ============================================================================
 # CREATE - Add a new board game
 # ============================================================================
 
 @router.post(
     "",
-    response_model=BoardGameResponse,
+    response_class=PydanticJSONResponse,
+    responses={status.HTTP_201_CREATED: {"model": BoardGameResponse}},
     status_code=status.HTTP_201_CREATED,
     summary="Create a new board game",
     description="Add a new board game to the database"
@@ -49,7 +142,7 @@ router = APIRouter(prefix="/games", tags=["Board Games"])
 async def create_game(
     game_data: BoardGameCreate,
     db: DatabaseSession
-) -> BoardGame:
+) -> PydanticJSONResponse:
     """
     Creates a new board game.
     
@@ -57,27 +150,35 @@ async def create_game(
     1. game_data is automatically validated by Pydantic
     2. We create a SQLAlchemy BoardGame object from the validated data
     3. Add it to the session and commit to the database
-    4. Return the created object (FastAPI converts it to BoardGameResponse)
+    4. Return the created object as a BoardGameResponse (JSON)
     
     Educational Note: The async/await pattern here:
     - db.add() is synchronous (just adds to session)
     - db.commit() is async (actually writes to database)
-    - db.refresh() is async (reloads the object with DB-generated values like id)
+
+    Educational Note: No db.refresh() needed
+    ----------------------------------------
+    The INSERT is sent as INSERT ... RETURNING id, created_at, updated_at
+    (eager_defaults on Base), so the DB-generated values are already on
+    db_game after commit. expire_on_commit=False keeps them loaded.
     """
     # Convert Pydantic model to SQLAlchemy model
-    # .model_dump() converts Pydantic model to a dictionary
-    db_game = BoardGame(**game_data.model_dump())
+    # .to_orm() copies the validated fields straight into a BoardGame
+    db_game = game_data.to_orm()
     
     # Add to session (doesn't write to DB yet)
     db.add(db_game)
     
-    # Commit the transaction (writes to DB)
+    # Commit the transaction (writes to DB, reads back id/created_at/updated_at)
     await db.commit()
     
-    # Refresh to get DB-generated fields (id, created_at, etc.)
-    await db.refresh(db_game)
+    # A new game changes every list page (and the total)
+    _response_cache.invalidate_prefix(_LIST_CACHE_PREFIX)
     
-    return db_game
+    return PydanticJSONResponse(
+        board_game_to_response(db_game),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 # ============================================================================
@@ -86,40 +187,161 @@ async def create_game(
 
 @router.get(
     "",
-    response_model=BoardGameListResponse,
+    response_class=PydanticJSONResponse,
+    responses={status.HTTP_200_OK: {"model": BoardGameListResponse}},
     summary="List all board games",
     description="Retrieve a list of all board games with optional pagination"
 )
 async def get_games(
     db: DatabaseSession,
-    skip: Annotated[int, Query()] = 0,
-    limit: Annotated[int, Query()] = 100
-) -> BoardGameListResponse:
+    skip: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    after_id: Annotated[Optional[int], Query()] = None,
+    expand: Annotated[set[Literal["users"]], Query()] = set(),
+) -> Response:
     """
-    Retrieves a paginated list of board games.
+    Retrieves a paginated list of board games, ordered by ID.
     
     Query Parameters:
     - skip: Number of records to skip (for pagination)
-    - limit: Maximum number of records to return
+    - limit: Maximum number of records to return (1-500, use /export for more)
+    - after_id: Only return games with an ID greater than this one
+      (keyset pagination: pass the last ID of the previous page)
+    - expand: Related data to include with each game; only "users" for now
+      (?expand=users adds a "users" list to every game)
     
     Educational Note: SQLAlchemy 2.0 query style:
     - select(BoardGame): Creates a SELECT query
+    - order_by(BoardGame.id): Stable ordering, so pages never overlap
     - offset(skip): SQL OFFSET clause (skip N rows)
     - limit(limit): SQL LIMIT clause (return max N rows)
     - await db.execute(): Runs the query asynchronously
-    - result.scalars().all(): Extracts the BoardGame objects
+    - result.all(): Extracts the (total, game) rows
+
+    Educational Note: OFFSET vs keyset pagination
+    ---------------------------------------------
+    OFFSET still reads (and throws away) every skipped row, so page 1000
+    is much slower than page 1. With after_id the primary key index jumps
+    straight to the first row of the page, no matter how deep it is.
+
+    Educational Note: Total in the same query
+    -----------------------------------------
+    The page is LEFT JOINed onto a one-row count(*) subquery:
+        SELECT total.total, page.* FROM (SELECT count(*) ...) AS total
+        LEFT JOIN (SELECT ... LIMIT ... OFFSET ...) AS page ON true
+    so every row carries the total, and a page past the end still returns
+    one row (total + NULL game). Page and count always come back in one
+    database round-trip. Unlike count(*) OVER (), the count ignores the
+    after_id filter and always counts the whole table.
+
+    Educational Note: raiseload("*")
+    --------------------------------
+    By default no relationship is loaded, and touching one raises an error
+    instead of silently firing one lazy query per game (the N+1 problem).
+    Relationships asked for with ?expand= are loaded up front instead:
+    selectinload for the users_games collection (one extra IN query for the
+    whole page) and joinedload for the single user behind each link.
+
+    Educational Note: Response cache
+    --------------------------------
+    The rendered page is kept in _response_cache for 60 seconds, keyed by
+    the query parameters, so repeated requests skip the database entirely.
+    Any create/update/delete drops all cached pages.
     """
-    # Query for games with pagination
-    query = select(BoardGame).offset(skip).limit(limit)
+    cache_key = f"{_LIST_CACHE_PREFIX}{skip}:{limit}:{after_id}:{','.join(sorted(expand))}"
+    if (cached := _response_cache.get(cache_key)) is not None:
+        return _cached_json_response(cached)
+    # Noted before querying: a write committed meanwhile blocks the set() below
+    generation = _response_cache.generation
+
+    # Query for the requested page of games
+    page_query = select(BoardGame).order_by(BoardGame.id)
+    if after_id is not None:
+        page_query = page_query.where(BoardGame.id > after_id)
+    page = page_query.offset(skip).limit(limit).subquery("page")
+    game = aliased(BoardGame, page, name="game")
+
+    # Total number of games, as a one-row subquery
+    total_query = select(func.count().label("total")).select_from(BoardGame)
+    total_subquery = total_query.subquery("total")
+
+    # Both together: one row per game (or a single row with no game)
+    query = (
+        select(total_subquery.c.total, game)
+        .select_from(total_subquery)
+        .outerjoin(page, true())
+        .order_by(page.c.id)
+        .options(raiseload("*"))
+    )
+    if "users" in expand:
+        query = query.options(
+            selectinload(game.users_games).joinedload(UsersGames.user_map)
+        )
+
     result = await db.execute(query)
-    games = result.scalars().all()
+    rows = result.all()
+    total = rows[0].total
+    to_dict = board_game_with_users_to_dict if "users" in expand else board_game_to_dict
+    games = [to_dict(row.game) for row in rows if row.game is not None]
+
+    # Plain dicts with the BoardGameListResponse shape, no models built
+    response = PydanticJSONResponse({"games": games, "total": total})
+    _response_cache.set(cache_key, response.body, generation)
+    return response
+
+
+# ============================================================================
+# READ - Export all board games (streamed)
+# ============================================================================
+# Declared before "/{game_id}" so "/export" isn't parsed as a game ID
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"model": list[BoardGameResponse]}},
+    summary="Export all board games",
+    description="Stream every board game as a single JSON array"
+)
+async def export_games(
+    db: DatabaseSession,
+) -> StreamingResponse:
+    """
+    Streams the whole boardgames table, without loading it all in memory.
+    
+    Educational Note: yield_per + stream_scalars
+    ---------------------------------------------
+    db.stream_scalars() uses a server-side cursor, and yield_per makes
+    SQLAlchemy fetch and build only _EXPORT_BATCH_SIZE games at a time.
+    Each batch is turned into JSON and sent before the next one is
+    fetched, so memory stays flat no matter how big the table is.
     
-    # Query for total count
-    count_query = select(func.count()).select_from(BoardGame)
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    Each batch is encoded with one call to BOARD_GAME_LIST_ADAPTER (a
+    TypeAdapter built once, at import time) instead of one call per game;
+    its surrounding brackets are dropped so the batches join into one array.
     
-    return BoardGameListResponse(games=games, total=total)
+    The session stays open while the response streams: FastAPI only runs
+    the cleanup part of get_db after the response has been sent.
+    """
+    query = (
+        select(BoardGame)
+        .options(raiseload("*"))
+        .order_by(BoardGame.id)
+        .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+    )
+
+    async def generate_json() -> AsyncIterator[bytes]:
+        result = await db.stream_scalars(query)
+        started = False
+        async for games in result.partitions():
+            batch = BOARD_GAME_LIST_ADAPTER.dump_json(
+                [board_game_to_response(game) for game in games]
+            )
+            # batch is "[{...},{...}]": keep only the items
+            yield (b"," if started else b"[") + batch[1:-1]
+            started = True
+        yield b"]" if started else b"[]"
+
+    return StreamingResponse(generate_json(), media_type="application/json")
 
 
 # ============================================================================
@@ -128,135 +350,255 @@ async def get_games(
 
 @router.get(
     "/{game_id}",
-    response_model=BoardGameResponse,
+    response_class=PydanticJSONResponse,
+    responses={status.HTTP_200_OK: {"model": BoardGameResponse}},
     summary="Get a board game by ID",
     description="Retrieve detailed information about a specific board game"
 )
 async def get_game(
     game_id: int,
     db: DatabaseSession,
-) -> BoardGame:
+) -> Response:
     """
     Retrieves a single board game by ID.
     
     Path Parameter:
     - game_id: The ID of the game to retrieve
     
-    Educational Note: db.get()
-    --------------------------
-    This is a convenience method for getting by primary key:
-        db.get(Model, primary_key_value)
+    Educational Note: Reusing a statement
+    -------------------------------------
+    _GET_BY_ID is built once, at import time. Each request only binds
+    game_id and executes it:
+        result = await db.execute(_GET_BY_ID, {"game_id": game_id})
     
-    Equivalent to:
+    Equivalent to (but without rebuilding the statement every time):
         result = await db.execute(select(BoardGame).where(BoardGame.id == game_id))
-        game = result.scalar_one_or_none()
-    """
-    game = await db.get(BoardGame, game_id)
     
-    if not game:
-        # 404 Not Found - resource doesn't exist
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Board game with ID {game_id} not found"
-        )
-    
-    return game
-
+    Educational Note: Response cache
+    --------------------------------
+    Found games are kept in _response_cache (as ready-to-send JSON) for
+    60 seconds; updating or deleting the game drops the cached copy.
+    """
+    return await _read_game(db, game_id)
 
-# ============================================================================
-# UPDATE - Modify an existing board game
-# ============================================================================
 
-@router.patch(
-    "/{game_id}",
-    response_model=BoardGameResponse,
-    summary="Update a board game",
-    description="Update specific fields of an existing board game"
-)
-async def update_game(
-    game_id: int,
-    game_updates: BoardGameUpdate,
-    db: DatabaseSession,
-) -> BoardGame:
+async def _read_game(db: AsyncSession, game_id: int) -> Response:
     """
-    Updates an existing board game.
-    
-    How it works:
-    1. Find the game in the database
-    2. Update only the fields that were provided (exclude_unset=True)
-    3. Commit the changes
-    4. Return the updated game
-    
-    Educational Note: exclude_unset=True
-    ------------------------------------
-    This only includes fields that were actually set in the request.
-    Without it, all optional fields would be set to None!
+    Returns the game as JSON: from _response_cache, or with one SELECT.
     
-    Example:
-        PATCH /games/1 {"name": "New Name"}
-        
-        With exclude_unset=True:
-            updates = {"name": "New Name"}  ✓ Only update name
-        
-        Without it:
-            updates = {"name": "New Name", "description": None, ...}  ✗ Clears other fields!
+    Shared by GET /games/{id} and PATCH requests that change nothing.
     """
-    # Find the game
-    game = await db.get(BoardGame, game_id)
+    cache_key = _game_cache_key(game_id)
+    if (cached := _response_cache.get(cache_key)) is not None:
+        return _cached_json_response(cached)
+    # Noted before querying: a write committed meanwhile blocks the set() below
+    generation = _response_cache.generation
+    
+    result = await db.execute(_GET_BY_ID, {"game_id": game_id})
+    game = result.scalar_one_or_none()
     
     if not game:
+        # 404 Not Found - resource doesn't exist
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Board game with ID {game_id} not found"
         )
     
-    # Update fields that were provided
-    update_data = game_updates.model_dump(exclude_unset=True)
-    
-    for field, value in update_data.items():
-        setattr(game, field, value)
-    
-    # Commit changes
-    await db.commit()
-    await db.refresh(game)
-    
-    return game
+    response = PydanticJSONResponse(board_game_to_dict(game))
+    _response_cache.set(cache_key, response.body, generation)
+    return response
 
 
 # ============================================================================
-# DELETE - Remove a board game
+# UPDATE / DELETE - Router bound to a session factory
 # ============================================================================
 
-@router.delete(
-    "/{game_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete a board game",
-    description="Remove a board game from the database"
-)
-async def delete_game(
-    game_id: int,
-    db: DatabaseSession,
-) -> None:
+def make_write_router(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> APIRouter:
     """
-    Deletes a board game.
+    Builds a router with the PATCH and DELETE routes, bound to `session_factory`.
     
-    Educational Note: 204 No Content
-    ---------------------------------
-    Status code 204 means "success, but no response body"
-    This is the standard for DELETE operations - the resource is gone,
-    so there's nothing to return!
+    Usage (see app/routers/v1/__init__.py):
+        v1_router.include_router(make_write_router(async_session_maker))
     
-    FastAPI will automatically:
-    - Return status 204
-    - Send an empty response body
-    """
-    game = await db.get(BoardGame, game_id)
+    The router has its own lifespan, which starts and stops the
+    WriteBatcher its writes go through; include_router merges it into
+    the app's lifespan.
     
-    if not game:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Board game with ID {game_id} not found"
-        )
+    Educational Note: Closures instead of Depends
+    ---------------------------------------------
+    With db: DatabaseSession, FastAPI resolves the get_db dependency on
+    every request: it calls the generator, keeps it on an exit stack and
+    closes it after the response. These handlers are closures over the
+    session factory instead, so each request just opens a session with
+    `async with session_factory() as db` - one less layer on the hot path.
     
-    await db.delete(game)
-    await db.commit()
+    The trade-off: app.dependency_overrides[get_db] doesn't reach them.
+    To point them at another database (e.g. in tests), include a router
+    built with a different session factory:
+        test_app.include_router(make_write_router(test_session_maker))
+    
+    Educational Note: Batched commits
+    ---------------------------------
+    The UPDATE/DELETE statements aren't committed by the request itself:
+    they are handed to a WriteBatcher, which runs the writes arriving
+    within a few milliseconds in one transaction, with a single COMMIT.
+    The request waits until its write is committed, then responds.
+    """
+    batcher = WriteBatcher(session_factory)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Run the write batcher while the app is up."""
+        await batcher.start()
+        yield
+        await batcher.stop()
+
+    write_router = APIRouter(
+        prefix="/games",
+        tags=["Board Games"],
+        lifespan=lifespan,  # Merged into the app's lifespan by include_router
+    )
+
+    # ------------------------------------------------------------------------
+    # UPDATE - Modify an existing board game
+    # ------------------------------------------------------------------------
+
+    @write_router.patch(
+        "/{game_id}",
+        response_class=PydanticJSONResponse,
+        responses={status.HTTP_200_OK: {"model": BoardGameResponse}},
+        summary="Update a board game",
+        description="Update specific fields of an existing board game"
+    )
+    async def update_game(
+        game_id: int,
+        game_updates: BoardGameUpdate,
+    ) -> Response:
+        """
+        Updates an existing board game.
+
+        How it works:
+        1. Collect only the fields that were provided (model_fields_set)
+        2. Send a single UPDATE ... RETURNING for them
+        3. Commit it (in a batch with other writes, see above)
+        4. Return the updated game (straight from RETURNING)
+
+        Educational Note: model_fields_set
+        ----------------------------------
+        Pydantic records which fields were actually set in the request.
+        Only those are updated - otherwise all optional fields would be set to None!
+
+        Example:
+            PATCH /games/1 {"name": "New Name"}
+
+            Only the fields that were set:
+                updates = {"name": "New Name"}  ✓ Only update name
+
+            Every field:
+                updates = {"name": "New Name", "description": None, ...}  ✗ Clears other fields!
+
+        Reading them with getattr() is cheaper than model_dump(exclude_unset=True),
+        which runs every field through Pydantic's serializer to build the same dict.
+        Only columns listed in _UPDATABLE_FIELDS can ever end up in the UPDATE.
+
+        Educational Note: UPDATE ... RETURNING
+        --------------------------------------
+        Loading the game, changing its attributes and refreshing it afterwards
+        costs three queries (SELECT, UPDATE, SELECT). A single UPDATE ...
+        RETURNING does the same in one: PostgreSQL sends back the updated
+        row (including the new updated_at), or nothing if the ID doesn't exist.
+        
+        The statement is plain Core, built on the table (_BOARDGAMES) rather
+        than the BoardGame class: the row comes back as a simple Row, with no
+        ORM object to build, and is returned as a BoardGameResponseDict.
+        """
+        fields_set = game_updates.model_fields_set
+
+        if not fields_set:
+            # PATCH {} changes nothing: answer exactly like GET /games/{id}
+            # (cached copy or one SELECT), with no UPDATE and no COMMIT
+            async with session_factory() as db:
+                return await _read_game(db, game_id)
+
+        # Update fields that were provided
+        update_data = {
+            field: getattr(game_updates, field)
+            for field in _UPDATABLE_FIELDS
+            if field in fields_set
+        }
+        params = {"game_id": game_id}
+        for field in _UPDATABLE_FIELDS:
+            params[f"set_{field}"] = field in update_data
+            params[f"new_{field}"] = update_data.get(field)
+
+        async def apply_update(db: AsyncSession) -> Optional[Row]:
+            result = await db.execute(_UPDATE_BY_ID, params)
+            return result.one_or_none()
+
+        # Returns once the batch containing this UPDATE is committed
+        row = await batcher.submit(apply_update)
+        # A plain dict: no model to build, pydantic-core encodes it as is
+        game = None if row is None else board_game_row_to_dict(row)
+
+        if not game:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Board game with ID {game_id} not found"
+            )
+
+        # Drop the cached copies that are now out of date
+        _response_cache.invalidate(_game_cache_key(game_id))
+        _response_cache.invalidate_prefix(_LIST_CACHE_PREFIX)
+
+        return PydanticJSONResponse(game)
+
+    # ------------------------------------------------------------------------
+    # DELETE - Remove a board game
+    # ------------------------------------------------------------------------
+
+    @write_router.delete(
+        "/{game_id}",
+        status_code=status.HTTP_204_NO_CONTENT,
+        summary="Delete a board game",
+        description="Remove a board game from the database"
+    )
+    async def delete_game(
+        game_id: int,
+    ) -> None:
+        """
+        Deletes a board game.
+
+        Educational Note: 204 No Content
+        ---------------------------------
+        Status code 204 means "success, but no response body"
+        This is the standard for DELETE operations - the resource is gone,
+        so there's nothing to return!
+
+        FastAPI will automatically:
+        - Return status 204
+        - Send an empty response body
+
+        Educational Note: DELETE ... WHERE
+        ----------------------------------
+        There's no need to load the game just to delete it: a single
+        DELETE statement does the job, and result.rowcount tells us whether
+        a row with that ID existed (0 means 404).
+        """
+        async def apply_delete(db: AsyncSession) -> int:
+            result = await db.execute(_DELETE_BY_ID, {"game_id": game_id})
+            return result.rowcount
+
+        # Returns once the batch containing this DELETE is committed
+        if await batcher.submit(apply_delete) == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Board game with ID {game_id} not found"
+            )
+
+        # Drop the cached copies that are now out of date
+        _response_cache.invalidate(_game_cache_key(game_id))
+        _response_cache.invalidate_prefix(_LIST_CACHE_PREFIX)
+
+    return write_router
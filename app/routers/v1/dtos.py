@@ -16,9 +16,53 @@ tables into one API response.
 """
 
 from datetime import datetime
-from typing import Optional
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Annotated, Any, Optional, TypedDict, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    create_model,
+    field_validator,
+)
+from sqlalchemy import Row
+
+from app.dependencies.external.database import BoardGame, User
+
+
+# ============================================================================
+# Field Descriptions - Only needed for the API docs
+# ============================================================================
+# The descriptions live here instead of in Field(description=...):
+# validation never reads them, so the models below only declare types and
+# constraints, and _add_descriptions() fills the descriptions in when a
+# JSON schema is generated (i.e. when /openapi.json is first requested).
+
+_FIELD_DESCRIPTIONS = {
+    "name": "Name of the board game",
+    "description": "Detailed description of the game",
+    "min_players": "Minimum number of players",
+    "max_players": "Maximum number of players",
+    "min_playtime": "Minimum playtime in minutes",
+    "max_playtime": "Maximum playtime in minutes",
+    "year_published": "Year the game was published",
+    "rating": "Average rating (0-10)",
+    "id": "Unique identifier",
+    "created_at": "When the game was added",
+    "updated_at": "When the game was last updated",
+    "users": "Users who have the game (only with ?expand=users)",
+    "games": "List of board games",
+    "total": "Total number of games in database",
+}
+
+
+def _add_descriptions(schema: dict[str, Any]) -> None:
+    """json_schema_extra hook: adds _FIELD_DESCRIPTIONS to the properties."""
+    for name, prop in schema.get("properties", {}).items():
+        if name in _FIELD_DESCRIPTIONS:
+            prop["description"] = _FIELD_DESCRIPTIONS[name]
 
 
 # ============================================================================
@@ -36,46 +80,36 @@ class BoardGameBase(BaseModel):
         ...,  # ... means required
         min_length=1,
         max_length=200,
-        description="Name of the board game"
-    )
-    description: Optional[str] = Field(
-        default=None,
-        description="Detailed description of the game"
     )
+    description: Optional[str] = None
     min_players: int = Field(
         ...,
         ge=1,  # Greater than or equal to 1
         le=100,
-        description="Minimum number of players"
-    )
-    max_players: int = Field(
-        ...,
-        ge=1,
-        le=100,
-        description="Maximum number of players"
-    )
-    min_playtime: Optional[int] = Field(
-        default=None,
-        ge=1,
-        description="Minimum playtime in minutes"
-    )
-    max_playtime: Optional[int] = Field(
-        default=None,
-        ge=1,
-        description="Maximum playtime in minutes"
-    )
-    year_published: Optional[int] = Field(
-        default=None,
-        ge=1900,
-        le=2100,
-        description="Year the game was published"
-    )
-    rating: Optional[float] = Field(
-        default=None,
-        ge=0.0,
-        le=10.0,
-        description="Average rating (0-10)"
     )
+    max_players: int = Field(..., ge=1, le=100)
+    min_playtime: Optional[int] = Field(default=None, ge=1)
+    max_playtime: Optional[int] = Field(default=None, ge=1)
+    year_published: Optional[int] = Field(default=None, ge=1900, le=2100)
+    rating: Optional[float] = Field(default=None, ge=0.0, le=10.0)
+    
+    # Inherited by every schema below (subclass configs are merged into it)
+    model_config = ConfigDict(json_schema_extra=_add_descriptions)
+
+    @field_validator("rating")
+    @classmethod
+    def _round_rating(cls, rating: Optional[float]) -> Optional[float]:
+        """
+        Round to one decimal place, like the NUMERIC(3, 1) column does.
+        
+        Without this, POST {"rating": 7.25} would answer 7.25 while the
+        database stores (and every later GET returns) 7.3. Rounding goes
+        through Decimal with ROUND_HALF_UP to match PostgreSQL: Python's
+        round(7.25, 1) gives 7.2.
+        """
+        if rating is None:
+            return None
+        return float(Decimal(str(rating)).quantize(Decimal("0.1"), ROUND_HALF_UP))
 
 
 # ============================================================================
@@ -92,22 +126,71 @@ class BoardGameCreate(BoardGameBase):
     Usage in endpoint:
         @router.post("/games")
         async def create_game(game: BoardGameCreate, db: DatabaseSession):
+            db.add(game.to_orm())
             ...
     """
-    pass
+
+    def to_orm(self) -> BoardGame:
+        """
+        Builds the SQLAlchemy BoardGame for this (already validated) data.
+        
+        The fields are copied one by one: unlike BoardGame(**self.model_dump()),
+        this skips Pydantic's serializer and the intermediate dict.
+        """
+        return BoardGame(
+            name=self.name,
+            description=self.description,
+            min_players=self.min_players,
+            max_players=self.max_players,
+            min_playtime=self.min_playtime,
+            max_playtime=self.max_playtime,
+            year_published=self.year_published,
+            rating=self.rating,
+        )
 
 
 # ============================================================================
 # Update Schema - For PUT/PATCH requests
 # ============================================================================
 
-class BoardGameUpdate(BaseModel):
+def _optional_fields(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Copies a model's fields as optional fields (default None).
+    
+    Each field keeps its constraints (min_length, ge, le, ...), so they are
+    declared once, on BoardGameBase, instead of repeated on every schema.
+    
+    Optional means "may be left out", not "may be null": a field only
+    accepts an explicit null if its original type already does. So
+    {"name": null} is rejected (422) instead of reaching the NOT NULL
+    column, while {"description": null} still clears the description.
+    """
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if field.metadata:
+            annotation = Annotated[(annotation, *field.metadata)]
+        fields[name] = (annotation, None)
+    return fields
+
+
+class BoardGameUpdate(
+    create_model(
+        "_BoardGameUpdateFields",
+        __base__=BoardGameBase,
+        **_optional_fields(BoardGameBase),
+    )
+):
     """
     Schema for updating an existing board game.
     
     All fields are optional - you can update just one field if you want!
     This is different from Create where some fields are required.
     
+    The fields are BoardGameBase's, made optional by _optional_fields(),
+    with the same validation rules - change a rule there and both
+    Create and Update follow.
+    
     Usage in endpoint:
         @router.patch("/games/{game_id}")
         async def update_game(
@@ -117,14 +200,10 @@ class BoardGameUpdate(BaseModel):
         ):
             ...
     """
-    name: Optional[str] = Field(default=None, min_length=1, max_length=200)
-    description: Optional[str] = None
-    min_players: Optional[int] = Field(default=None, ge=1, le=100)
-    max_players: Optional[int] = Field(default=None, ge=1, le=100)
-    min_playtime: Optional[int] = Field(default=None, ge=1)
-    max_playtime: Optional[int] = Field(default=None, ge=1)
-    year_published: Optional[int] = Field(default=None, ge=1900, le=2100)
-    rating: Optional[float] = Field(default=None, ge=0.0, le=10.0)
+    
+    # extra="forbid": unknown fields are rejected (422) instead of being
+    # silently dropped, so a typo like {"raiting": 9} doesn't "succeed"
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
 
 
 # ============================================================================
@@ -156,13 +235,128 @@ class BoardGameResponse(BoardGameBase):
     """
     
     # Additional fields that come from the database
-    id: int = Field(description="Unique identifier")
-    created_at: datetime = Field(description="When the game was added")
-    updated_at: datetime = Field(description="When the game was last updated")
+    id: int
+    created_at: datetime
+    updated_at: datetime
     
     # Configuration for Pydantic v2
-    # from_attributes=True allows creating from SQLAlchemy models
-    model_config = ConfigDict(from_attributes=True)
+    # - from_attributes=True: allows creating from SQLAlchemy models
+    # - frozen=True: responses are read-only once built (assignment raises)
+    # - extra="ignore", revalidate_instances="never": the defaults, spelled
+    #   out - extra input is dropped, and a BoardGameResponse nested in
+    #   another model (BoardGameListResponse) isn't validated a second time
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        extra="ignore",
+        revalidate_instances="never",
+    )
+
+
+class BoardGameResponseDict(TypedDict):
+    """
+    The same data as BoardGameResponse, as a plain dict.
+    
+    Built by board_game_to_dict() / board_game_row_to_dict(): no model is
+    built at all, and PydanticJSONResponse encodes the dict directly.
+    BoardGameResponse stays the documented schema.
+    """
+    id: int
+    name: str
+    description: Optional[str]
+    min_players: int
+    max_players: int
+    min_playtime: Optional[int]
+    max_playtime: Optional[int]
+    year_published: Optional[int]
+    rating: Optional[float]
+    created_at: datetime
+    updated_at: datetime
+
+
+# Field names of BoardGameResponse, computed once
+_RESPONSE_FIELDS = tuple(BoardGameResponse.model_fields)
+
+
+def board_game_to_response(game: BoardGame) -> BoardGameResponse:
+    """
+    Builds a BoardGameResponse from a BoardGame without validating it.
+    
+    model_validate(game) would run every field validator again, but data
+    coming out of our own database is already typed and valid. model_construct
+    just sets the fields, which is many times faster.
+    
+    Only use this for trusted (database) data - requests must still go
+    through normal validation (BoardGameCreate, BoardGameUpdate).
+    """
+    return BoardGameResponse.model_construct(
+        **{field: getattr(game, field) for field in _RESPONSE_FIELDS}
+    )
+
+
+def board_game_to_dict(game: BoardGame) -> BoardGameResponseDict:
+    """
+    Like board_game_to_response(), but builds a plain dict instead of a model.
+    
+    For the hot read endpoints: a dict per game is cheaper to build than
+    a model instance, and pydantic-core encodes dicts just as well
+    (PydanticJSONResponse), so no BaseModel is involved at all. Together
+    this takes a page of 100 games to JSON roughly 2-3x faster.
+    """
+    return {field: getattr(game, field) for field in _RESPONSE_FIELDS}
+
+
+def board_game_row_to_dict(row: Row) -> BoardGameResponseDict:
+    """
+    board_game_to_dict() for a Core result row (e.g. from UPDATE ... RETURNING).
+    
+    The keys follow _RESPONSE_FIELDS, not the table's column order, so the
+    JSON looks the same as from every other endpoint.
+    """
+    mapping = row._mapping
+    return {field: mapping[field] for field in _RESPONSE_FIELDS}
+
+
+# ============================================================================
+# Expanded Response - Games with their users (?expand=users)
+# ============================================================================
+
+class UserSummary(BaseModel):
+    """The public part of a user, as embedded in expanded game responses."""
+    id: int
+    name: str
+    surname: str
+
+
+class BoardGameWithUsersResponse(BoardGameResponse):
+    """A BoardGameResponse plus the users who have the game."""
+    users: list[UserSummary]
+
+
+_USER_SUMMARY_FIELDS = tuple(UserSummary.model_fields)
+
+
+def _user_to_dict(user: User) -> dict[str, Any]:
+    return {field: getattr(user, field) for field in _USER_SUMMARY_FIELDS}
+
+
+def board_game_with_users_to_dict(game: BoardGame) -> dict[str, Any]:
+    """
+    board_game_to_dict() plus a "users" list.
+    
+    The game's users_games (and each link's user) must already be loaded,
+    e.g. with selectinload(...).joinedload(...) - touching them here must
+    not fire a query per game.
+    """
+    payload = board_game_to_dict(game)
+    payload["users"] = [_user_to_dict(link.user_map) for link in game.users_games]
+    return payload
+
+
+# Serializer for plain lists of games (e.g. the export endpoint)
+# Building a TypeAdapter compiles its schema, so it's done once, here,
+# and reused for every list instead of being rebuilt per call
+BOARD_GAME_LIST_ADAPTER = TypeAdapter(list[BoardGameResponse])
 
 
 # ============================================================================
@@ -179,7 +373,11 @@ class BoardGameListResponse(BaseModel):
     - Current page
     - Has more results?
     """
-    games: list[BoardGameResponse] = Field(description="List of board games")
-    total: int = Field(description="Total number of games in database")
+    # Games carry a "users" list when requested with ?expand=users
+    games: list[Union[BoardGameWithUsersResponse, BoardGameResponse]]
+    total: int
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra=_add_descriptions,
+    )
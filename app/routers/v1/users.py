@@ -1,16 +1,44 @@
-from fastapi import APIRouter, HTTPException
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import APIRouter, FastAPI, HTTPException, status
 import httpx
 
+
+# One HTTP client shared by every request
+# Creating a client per request means a new connection pool, and a new
+# TCP + TLS handshake, every time. The shared client keeps connections alive.
+_client: Optional[httpx.AsyncClient] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the shared HTTP client on startup and close it on shutdown."""
+    global _client
+    _client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    )
+    yield
+    await _client.aclose()
+    _client = None
+
+
 router = APIRouter(
     prefix="/users",
-    tags=["Users"]
+    tags=["Users"],
+    lifespan=lifespan,  # Merged into the app's lifespan by include_router
 )
 
 @router.get("/data")
 async def get_data():
 
-    async with httpx.AsyncClient() as client:
+    response = await _client.get("https://api.example.com/data")
 
-        response = await client.get("https://api.example.com/data")
+    if response.is_error:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Upstream API returned status {response.status_code}"
+        )
 
-        return response.json()
\ No newline at end of file
+    return response.json()